@@ -0,0 +1,28 @@
+"""ensure items owner_id id index
+
+Databases created by create_all before Alembic was introduced are stamped at
+the initial revision by app/db/migrations.py, but they lack this index.
+
+Revision ID: 22b4acd0c78c
+Revises: 343de163ef81
+Create Date: 2026-10-15 07:31:12.480211
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '22b4acd0c78c'
+down_revision = '343de163ef81'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_items_owner_id_id', 'items', ['owner_id', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    # The index belongs to the initial revision; nothing to undo
+    pass
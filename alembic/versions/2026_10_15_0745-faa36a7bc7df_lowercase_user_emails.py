@@ -0,0 +1,38 @@
+"""lowercase user emails
+
+Emails are now stored and looked up lowercased; rows written earlier may still
+have an uppercase local part and could no longer log in.
+
+Revision ID: faa36a7bc7df
+Revises: 22b4acd0c78c
+Create Date: 2026-10-15 07:45:03.118942
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'faa36a7bc7df'
+down_revision = '22b4acd0c78c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    # Accounts differing only in case would collide on the unique email index
+    duplicates = conn.execute(sa.text(
+        "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Cannot lowercase user emails, these addresses belong to several accounts "
+            f"differing only in case; merge or rename them first: {', '.join(duplicates)}"
+        )
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    # The original casing is not kept; lowercased emails remain valid
+    pass
@@ -6,7 +6,8 @@ from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas
 from app.core import security
@@ -17,9 +18,9 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=schemas.User, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: schemas.UserCreate,
 ) -> Any:
     """
@@ -29,33 +30,36 @@ def register(
     - **password**: Password (minimum 6 characters)
     - **full_name**: Optional full name
     """
-    # Check if user already exists
-    user = crud.crud_user.get_user_by_email(db, email=user_in.email)
-    if user:
+    # Create new user; the unique index on email rejects duplicates
+    try:
+        user = await crud.crud_user.create_user(db, user=user_in)
+    except IntegrityError as error:
+        await db.rollback()
+        if not crud.crud_user.is_duplicate_email(error):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A user with this email already exists",
         )
-    
-    # Create new user
-    user = crud.crud_user.create_user(db, user=user_in)
-    return user
+    return schemas.User.from_row(user)
 
 
 @router.post("/login", response_model=schemas.Token)
-def login(
-    db: Session = Depends(get_db),
+async def login(
+    db: AsyncSession = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login.
     Get an access token and refresh token for future requests.
     
-    - **username**: User email address
+    - **username**: User email address (case-insensitive)
     - **password**: User password
     """
-    # Authenticate user
-    user = crud.crud_user.authenticate_user(db, email=form_data.username, password=form_data.password)
+    # Authenticate user; emails are stored lowercased
+    user = await crud.crud_user.authenticate_user(
+        db, email=form_data.username.strip().lower(), password=form_data.password
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -81,9 +85,9 @@ def login(
 
 
 @router.post("/refresh", response_model=schemas.Token)
-def refresh_token(
+async def refresh_token(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     token_data: schemas.TokenRefresh,
 ) -> Any:
     """
@@ -113,7 +117,7 @@ def refresh_token(
     
     # Get user from token
     email: str = payload.get("sub")
-    user = crud.crud_user.get_user_by_email(db, email=email)
+    user = await crud.crud_user.get_user_by_email(db, email=email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -138,11 +142,11 @@ def refresh_token(
 
 
 @router.post("/test-token", response_model=schemas.User)
-def test_token(
+async def test_token(
     current_user: schemas.User = Depends(security.get_current_active_user),
 ) -> Any:
     """
     Test access token validity.
     Returns current user information if token is valid.
     """
-    return current_user
+    return schemas.User.from_row(current_user)
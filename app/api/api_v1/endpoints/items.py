@@ -2,21 +2,25 @@
 Item management endpoints.
 Provides CRUD operations for items with ownership verification.
 """
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
-from app.core import security
+from app.core import http_cache, response_cache, security
+from app.core.responses import PydanticJSONResponse, list_response
 from app.db.session import get_db
 
 router = APIRouter()
 
+# Maximum number of items accepted by one bulk create request
+MAX_BULK_ITEMS = 1000
+
 
 @router.post("/", response_model=schemas.Item, status_code=status.HTTP_201_CREATED)
-def create_item(
+async def create_item(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     item_in: schemas.ItemCreate,
     current_user: models.User = Depends(security.get_current_active_user),
 ) -> Any:
@@ -27,70 +31,144 @@ def create_item(
     - **title**: Item title (required)
     - **description**: Item description (optional)
     """
-    item = crud.crud_item.create_item(db, item=item_in, owner_id=current_user.id)
-    return item
+    item = await crud.crud_item.create_item(db, item=item_in, owner_id=current_user.id)
+    await response_cache.invalidate("items")
+    return schemas.Item.from_row(item)
+
+
+@router.post("/bulk", response_model=List[schemas.Item], status_code=status.HTTP_201_CREATED)
+async def create_items_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    items_in: List[schemas.ItemCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    current_user: models.User = Depends(security.get_current_active_user),
+) -> Any:
+    """
+    Create several items in one request with a single INSERT statement.
+    Requires authentication.
+    
+    - **body**: List of items, each with a title (required) and description (optional)
+    """
+    items = await crud.crud_item.create_items_bulk(db, items=items_in, owner_id=current_user.id)
+    await response_cache.invalidate("items")
+    return list_response(
+        schemas.ITEM_LIST_ADAPTER, schemas.Item, items, status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("/", response_model=List[schemas.Item])
-def read_items(
-    db: Session = Depends(get_db),
+@response_cache.cached("items")
+async def read_items(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
 ) -> Any:
     """
-    Retrieve list of all items.
+    Retrieve list of all items, ordered by ID.
     Public endpoint - no authentication required.
+    Supports conditional requests via ETag / If-None-Match.
+    The number of matching items is returned in the `X-Total-Count` header.
+    Responses are cached until the next item write.
     
     - **skip**: Number of records to skip (pagination)
     - **limit**: Maximum number of records to return
+    - **after_id**: Return items after this ID (keyset pagination, see `X-Next-Cursor`)
     """
-    items = crud.crud_item.get_items(db, skip=skip, limit=limit)
-    return items
+    items, total = await crud.crud_item.get_items_page(
+        db, skip=skip, limit=limit, after_id=after_id
+    )
+    
+    # The page is fully determined by its rows' IDs and modification times
+    etag = http_cache.make_etag(
+        skip, limit, after_id, total, [(item.id, item.updated_at) for item in items]
+    )
+    not_modified = http_cache.conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    response.headers["X-Total-Count"] = str(total)
+    if items and len(items) == limit:
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+    return list_response(schemas.ITEM_LIST_ADAPTER, schemas.Item, items, headers=response.headers)
 
 
 @router.get("/my-items", response_model=List[schemas.Item])
-def read_my_items(
-    db: Session = Depends(get_db),
+@response_cache.cached("items", vary_on_user=True)
+async def read_my_items(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: models.User = Depends(security.get_current_active_user),
+    after_id: Optional[int] = None,
+    current_user_email: str = Depends(security.get_token_subject),
 ) -> Any:
     """
-    Retrieve current user's items.
-    Requires authentication.
+    Retrieve current user's items, ordered by ID.
+    Requires authentication; the user is resolved in the same query as the page.
+    The number of matching items is returned in the `X-Total-Count` header.
+    Responses are cached per user until the next item or user write.
     
     - **skip**: Number of records to skip (pagination)
     - **limit**: Maximum number of records to return
+    - **after_id**: Return items after this ID (keyset pagination, see `X-Next-Cursor`)
     """
-    items = crud.crud_item.get_items_by_owner(
-        db, owner_id=current_user.id, skip=skip, limit=limit
+    # Items are filtered on the token's subject being an active user, so a
+    # non-empty page also proves the user is valid
+    items, total = await crud.crud_item.get_items_page(
+        db,
+        skip=skip,
+        limit=limit,
+        after_id=after_id,
+        owner_email=current_user_email,
     )
-    return items
+    if not items:
+        # Tell an empty page apart from a missing or inactive user
+        current_user = await security.get_current_user(db, email=current_user_email)
+        await security.get_current_active_user(current_user)
+    
+    response.headers["X-Total-Count"] = str(total)
+    if items and len(items) == limit:
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+    return list_response(schemas.ITEM_LIST_ADAPTER, schemas.Item, items, headers=response.headers)
 
 
 @router.get("/{item_id}", response_model=schemas.Item)
-def read_item(
+@response_cache.cached("items")
+async def read_item(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     item_id: int,
 ) -> Any:
     """
     Get item by ID.
     Public endpoint - no authentication required.
+    Supports conditional requests via ETag / If-None-Match.
+    Responses are cached until the next item write.
     """
-    item = crud.crud_item.get_item(db, item_id=item_id)
+    item = await crud.crud_item.get_item(db, item_id=item_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Item not found",
         )
-    return item
+    
+    etag = http_cache.make_etag(item.id, item.updated_at)
+    not_modified = http_cache.conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    return PydanticJSONResponse(schemas.Item.from_row(item), headers=response.headers)
 
 
 @router.put("/{item_id}", response_model=schemas.Item)
-def update_item(
+async def update_item(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     item_id: int,
     item_in: schemas.ItemUpdate,
     current_user: models.User = Depends(security.get_current_active_user),
@@ -102,49 +180,58 @@ def update_item(
     - **title**: Optional new title
     - **description**: Optional new description
     """
-    # Get item
-    item = crud.crud_item.get_item(db, item_id=item_id)
-    if not item:
+    # Update with the ownership check in the WHERE clause
+    item = await crud.crud_item.update_item(
+        db,
+        item_id=item_id,
+        item_update=item_in,
+        actor_id=current_user.id,
+        is_superuser=current_user.is_superuser,
+    )
+    if item:
+        await response_cache.invalidate("items")
+        return schemas.Item.from_row(item)
+    
+    # No row matched: tell a missing item apart from someone else's item
+    if not await crud.crud_item.item_exists(db, item_id=item_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Item not found",
         )
-    
-    # Check ownership
-    if item.owner_id != current_user.id and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions. You can only update your own items.",
-        )
-    
-    item = crud.crud_item.update_item(db, item_id=item_id, item_update=item_in)
-    return item
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not enough permissions. You can only update your own items.",
+    )
 
 
-@router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_item(
+@router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+async def delete_item(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     item_id: int,
     current_user: models.User = Depends(security.get_current_active_user),
-) -> None:
+) -> Response:
     """
     Delete an item.
     Only the owner or superuser can delete an item.
     """
-    # Get item
-    item = crud.crud_item.get_item(db, item_id=item_id)
-    if not item:
+    # Delete with the ownership check in the WHERE clause
+    if await crud.crud_item.delete_item(
+        db,
+        item_id=item_id,
+        actor_id=current_user.id,
+        is_superuser=current_user.is_superuser,
+    ):
+        await response_cache.invalidate("items")
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    # No row matched: tell a missing item apart from someone else's item
+    if not await crud.crud_item.item_exists(db, item_id=item_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Item not found",
         )
-    
-    # Check ownership
-    if item.owner_id != current_user.id and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions. You can only delete your own items.",
-        )
-    
-    crud.crud_item.delete_item(db, item_id=item_id)
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not enough permissions. You can only delete your own items.",
+    )
@@ -2,31 +2,33 @@
 User management endpoints.
 Provides CRUD operations for user accounts with authentication.
 """
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
-from app.core import security
+from app.core import response_cache, security
+from app.core.responses import PydanticJSONResponse, list_response
 from app.db.session import get_db
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=schemas.User)
-def read_user_me(
+async def read_user_me(
     current_user: models.User = Depends(security.get_current_active_user),
 ) -> Any:
     """
     Get current authenticated user.
     """
-    return current_user
+    return PydanticJSONResponse(schemas.User.from_row(current_user))
 
 
 @router.put("/me", response_model=schemas.User)
-def update_user_me(
+async def update_user_me(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: schemas.UserUpdate,
     current_user: models.User = Depends(security.get_current_active_user),
 ) -> Any:
@@ -37,30 +39,34 @@ def update_user_me(
     - **full_name**: Optional new full name
     - **password**: Optional new password
     """
-    # Check if email is being changed and if it's already taken
-    if user_in.email and user_in.email != current_user.email:
-        existing_user = crud.crud_user.get_user_by_email(db, email=user_in.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="A user with this email already exists",
-            )
-    
-    user = crud.crud_user.update_user(db, user_id=current_user.id, user_update=user_in)
-    return user
+    # The unique index on email rejects a change to an email that's already taken
+    try:
+        user = await crud.crud_user.update_user(db, user_id=current_user.id, user_update=user_in)
+    except IntegrityError as error:
+        await db.rollback()
+        if user_in.email is None or not crud.crud_user.is_duplicate_email(error):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A user with this email already exists",
+        )
+    # Cached my-items pages are served without loading the user; drop them
+    # in case the user was deactivated or changed email
+    await response_cache.invalidate("items")
+    return schemas.User.from_row(user)
 
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user_by_id(
+async def read_user_by_id(
     user_id: int,
     current_user: models.User = Depends(security.get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Get a specific user by ID.
     Requires authentication.
     """
-    user = crud.crud_user.get_user(db, user_id=user_id)
+    user = await crud.crud_user.get_user(db, user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,22 +80,25 @@ def read_user_by_id(
             detail="Not enough permissions",
         )
     
-    return user
+    return schemas.User.from_row(user)
 
 
 @router.get("/", response_model=List[schemas.User])
-def read_users(
-    db: Session = Depends(get_db),
+async def read_users(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     current_user: models.User = Depends(security.get_current_active_user),
 ) -> Any:
     """
-    Retrieve list of users.
+    Retrieve list of users, ordered by ID.
     Only accessible by superusers.
     
     - **skip**: Number of records to skip (pagination)
     - **limit**: Maximum number of records to return
+    - **after_id**: Return users after this ID (keyset pagination, see `X-Next-Cursor`)
     """
     if not current_user.is_superuser:
         raise HTTPException(
@@ -97,23 +106,25 @@ def read_users(
             detail="Not enough permissions. Superuser access required.",
         )
     
-    users = crud.crud_user.get_users(db, skip=skip, limit=limit)
-    return users
+    users = await crud.crud_user.get_users(db, skip=skip, limit=limit, after_id=after_id)
+    if users and len(users) == limit:
+        response.headers["X-Next-Cursor"] = str(users[-1].id)
+    return list_response(schemas.USER_LIST_ADAPTER, schemas.User, users, headers=response.headers)
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+async def delete_user(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int,
     current_user: models.User = Depends(security.get_current_active_user),
-) -> None:
+) -> Response:
     """
     Delete a user.
     Users can delete their own account, superusers can delete any account.
     """
     # Check if user exists
-    user = crud.crud_user.get_user(db, user_id=user_id)
+    user = await crud.crud_user.get_user(db, user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -127,4 +138,7 @@ def delete_user(
             detail="Not enough permissions",
         )
     
-    crud.crud_user.delete_user(db, user_id=user_id)
+    await crud.crud_user.delete_user(db, user_id=user_id)
+    # The user's items were deleted with it
+    await response_cache.invalidate("items")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,7 +2,8 @@
 Core configuration module using Pydantic Settings.
 Loads environment variables and provides application configuration.
 """
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -23,6 +24,12 @@ class Settings(BaseSettings):
     
     # Database Configuration
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25  # persistent connections per worker process
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800  # seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statements per connection
+    DB_QUERY_CACHE_SIZE: int = 1200  # compiled SQL statements kept by SQLAlchemy (LRU)
     
     # JWT Configuration
     SECRET_KEY: str
@@ -30,27 +37,63 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
-    # CORS Configuration
-    BACKEND_CORS_ORIGINS: Union[List[str], str] = []
+    # Argon2id password hashing cost (defaults: 19 MiB memory, 2 iterations,
+    # 1 lane, OWASP's recommended minimum). Only lower these for tests.
+    PASSWORD_HASH_TIME_COST: int = 2
+    PASSWORD_HASH_MEMORY_COST: int = 19456  # KiB
+    PASSWORD_HASH_PARALLELISM: int = 1
+    
+    # CORS Configuration (str is kept in the union so a comma-separated
+    # value is not rejected as invalid JSON before the validator runs)
+    BACKEND_CORS_ORIGINS: Union[Tuple[str, ...], str] = ()
+    
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def use_async_driver(cls, v: str) -> str:
+        """Point synchronous PostgreSQL URLs (postgresql://, postgres://, psycopg2) at asyncpg."""
+        scheme, sep, rest = v.partition("://")
+        if sep and scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+            return f"postgresql+asyncpg://{rest}"
+        return v
     
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
-    def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
-        """Parse CORS origins from comma-separated string or list."""
+    def assemble_cors_origins(cls, v: Union[str, List[str], Tuple[str, ...]]) -> Tuple[str, ...]:
+        """Parse CORS origins once from a comma-separated string or list into a tuple."""
         if v is None or v == "":
-            return []
+            return ()
         if isinstance(v, str):
             # Split by comma and filter empty strings
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        if isinstance(v, list):
-            return v
-        return []
+            return tuple(origin.strip() for origin in v.split(",") if origin.strip())
+        if isinstance(v, (list, tuple)):
+            return tuple(str(origin) for origin in v)
+        return ()
+    
+    # Response cache for public and per-user reads (disabled when REDIS_URL is unset)
+    REDIS_URL: Optional[str] = None
+    RESPONSE_CACHE_TTL: int = 300  # seconds
     
     # First Superuser (for initial setup)
     FIRST_SUPERUSER_EMAIL: str = "admin@example.com"
     FIRST_SUPERUSER_PASSWORD: str = "admin123"
+    
+    # Apply migrations and create the first superuser when the app starts. Leave off for
+    # API workers and run scripts/bootstrap.py once per deployment instead.
+    RUN_STARTUP_BOOTSTRAP: bool = False
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsed from the environment once.
+    Can be used as a FastAPI dependency: settings: Settings = Depends(get_settings)
+    
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
@@ -0,0 +1,19 @@
+"""
+CORS middleware with constant-time origin checks.
+"""
+from typing import Sequence
+
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+from starlette.types import ASGIApp
+
+
+class CORSMiddleware(StarletteCORSMiddleware):
+    """
+    Starlette's CORSMiddleware with the allowed origins stored as a frozenset.
+    The base class checks `origin in self.allow_origins` on every CORS request,
+    which is a linear scan for a list or tuple.
+    """
+    
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins = frozenset(allow_origins)
@@ -0,0 +1,70 @@
+"""
+HTTP caching helpers for public GET endpoints.
+Builds weak ETags and answers conditional requests with 304 Not Modified.
+"""
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+# Cache-Control for public, frequently changing resources
+PUBLIC_CACHE_CONTROL = "public, max-age=5"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a response is rendered from.
+    
+    Args:
+        parts: Values that change whenever the response body changes
+        
+    Returns:
+        Weak ETag, e.g. W/"3f2a..."
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag (weak comparison).
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        
+    Returns:
+        True if the client's cached copy is still current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in header.split(","))
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+) -> Optional[Response]:
+    """
+    Set caching headers for a GET response and short-circuit unchanged resources.
+    
+    Args:
+        request: Incoming request
+        response: Response the endpoint's headers are set on
+        etag: Current ETag of the resource
+        cache_control: Cache-Control header value
+        
+    Returns:
+        A 304 Not Modified response if the client's copy is current, None otherwise
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
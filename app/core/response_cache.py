@@ -0,0 +1,180 @@
+"""
+Shared cache of rendered GET responses.
+Entries are grouped into namespaces with a generation counter: every write to a
+namespace bumps its generation, which makes all of its cached responses
+unreachable at once. Backed by Redis when REDIS_URL is set and disabled
+otherwise, since a per-process cache could not be invalidated across workers.
+"""
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+from cachetools import TTLCache
+from fastapi import Request, Response, status
+
+from app.core import http_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """In-process backend for tests and single-process development."""
+    
+    def __init__(self, maxsize: int = 10_000, ttl: int = settings.RESPONSE_CACHE_TTL) -> None:
+        self._entries: "TTLCache[str, bytes]" = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: Dict[str, int] = {}
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+    
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._entries[key] = value
+    
+    async def get_generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+    
+    async def bump_generation(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+    
+    async def close(self) -> None:
+        pass
+    
+    def clear(self) -> None:
+        """Drop all entries and generations."""
+        self._entries.clear()
+        self._generations.clear()
+
+
+class RedisBackend:
+    """Redis backend shared by all workers."""
+    
+    def __init__(self, url: str) -> None:
+        self._redis = redis.from_url(url)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(key)
+    
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._redis.set(key, value, ex=ttl)
+    
+    async def get_generation(self, namespace: str) -> int:
+        return int(await self._redis.get(f"generation:{namespace}") or 0)
+    
+    async def bump_generation(self, namespace: str) -> None:
+        await self._redis.incr(f"generation:{namespace}")
+    
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+_backend: Optional[Any] = None
+
+
+def configure(backend: Optional[Any]) -> None:
+    """
+    Set the cache backend (None disables caching).
+    
+    Args:
+        backend: MemoryBackend, RedisBackend or None
+    """
+    global _backend
+    _backend = backend
+
+
+async def init() -> None:
+    """Connect the Redis backend if REDIS_URL is set. Call once per worker on startup."""
+    if settings.REDIS_URL:
+        configure(RedisBackend(settings.REDIS_URL))
+
+
+async def close() -> None:
+    """Release the backend's connections. Call on shutdown."""
+    if _backend is not None:
+        await _backend.close()
+
+
+async def invalidate(namespace: str) -> None:
+    """
+    Invalidate every cached response in a namespace.
+    Call after each successful write to the data the namespace caches.
+    Failures are logged, not raised: the write has already been committed,
+    and stale entries expire after RESPONSE_CACHE_TTL.
+    
+    Args:
+        namespace: Cache namespace, e.g. "items"
+    """
+    if _backend is None:
+        return
+    try:
+        await _backend.bump_generation(namespace)
+    except Exception:
+        logger.warning("Response cache invalidation failed for %s", namespace, exc_info=True)
+
+
+def _encode(response: Response) -> bytes:
+    """Serialize a rendered response for storage."""
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return orjson.dumps({"headers": headers, "body": response.body.decode()})
+
+
+def _decode(request: Request, entry: bytes) -> Response:
+    """Rebuild a stored response, answering If-None-Match with 304 Not Modified."""
+    data = orjson.loads(entry)
+    headers = data["headers"]
+    etag = headers.get("etag")
+    if etag and http_cache.etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": headers.get("cache-control", "")},
+        )
+    return Response(content=data["body"].encode(), headers=headers)
+
+
+def cached(namespace: str, vary_on_user: bool = False) -> Callable:
+    """
+    Cache an endpoint's 200 responses in a namespace.
+    The endpoint must take `request: Request` (and `current_user_email`, the
+    access token's subject, when vary_on_user is set) and return a rendered
+    Response. Cached per-user responses are served without loading the user,
+    so writes that deactivate or remove users must invalidate the namespace.
+    
+    Args:
+        namespace: Cache namespace invalidated by writes to the same data
+        vary_on_user: Whether the response depends on the authenticated user
+        
+    Returns:
+        Endpoint decorator
+    """
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs) -> Any:
+            if _backend is None:
+                return await endpoint(*args, **kwargs)
+            
+            request: Request = kwargs["request"]
+            user = kwargs["current_user_email"] if vary_on_user else ""
+            try:
+                generation = await _backend.get_generation(namespace)
+                key = f"response:{namespace}:{generation}:{user}:{request.url.path}?{request.url.query}"
+                entry = await _backend.get(key)
+            except Exception:
+                # Cache unavailable: serve the request from the database
+                logger.warning("Response cache read failed for %s", request.url.path, exc_info=True)
+                return await endpoint(*args, **kwargs)
+            if entry is not None:
+                return _decode(request, entry)
+            
+            response = await endpoint(*args, **kwargs)
+            if isinstance(response, Response) and response.status_code == status.HTTP_200_OK:
+                try:
+                    await _backend.set(key, _encode(response), settings.RESPONSE_CACHE_TTL)
+                except Exception:
+                    logger.warning("Response cache write failed for %s", request.url.path, exc_info=True)
+            return response
+        
+        return wrapper
+    
+    return decorator
@@ -0,0 +1,52 @@
+"""
+Response classes for hot read endpoints.
+"""
+from typing import Any, Iterable, Mapping, Optional
+
+import pydantic_core
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+class PydanticJSONResponse(Response):
+    """
+    JSON response rendered by pydantic-core from a single schema instance.
+    Lists are rendered with list_response instead.
+    
+    Returning it from an endpoint skips FastAPI's response_model handling
+    (validate the return value, dump it to Python objects, then encode them)
+    in favour of a single serialization pass. Keep `response_model` on the
+    route so the OpenAPI schema is unchanged.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+def list_response(
+    adapter: TypeAdapter,
+    schema: Any,
+    rows: Iterable[Any],
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Render ORM rows as a JSON array in a single pydantic-core pass.
+    
+    Args:
+        adapter: List TypeAdapter of the schema, e.g. schemas.ITEM_LIST_ADAPTER
+        schema: Response schema providing from_row, e.g. schemas.Item
+        rows: Loaded model instances
+        status_code: HTTP status code
+        headers: Extra response headers (e.g. the injected response's headers)
+        
+    Returns:
+        Rendered JSON response
+    """
+    return Response(
+        content=adapter.dump_json([schema.from_row(row) for row in rows]),
+        media_type="application/json",
+        status_code=status_code,
+        headers=headers,
+    )
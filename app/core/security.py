@@ -4,19 +4,27 @@ Implements both access tokens and refresh tokens for enhanced security.
 """
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
-from jose import jwt, JWTError
+import jwt
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import token_cache
 from app.core.config import settings
 from app.db.session import get_db
 from app import crud, models, schemas
 
-# Password hashing context using pwdlib with Argon2
-password_hash = PasswordHash((Argon2Hasher(),))
+# Password hashing context using pwdlib with Argon2id. Hashes record their
+# own parameters, so changing the cost settings never breaks verification.
+password_hash = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.PASSWORD_HASH_TIME_COST,
+        memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+        parallelism=settings.PASSWORD_HASH_PARALLELISM,
+    ),
+))
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
@@ -25,6 +33,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
+    CPU-bound: call it via asyncio.to_thread from async code.
     
     Args:
         plain_password: Plain text password
@@ -38,7 +47,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using Argon2.
+    Hash a password using Argon2id.
+    CPU-bound: call it via asyncio.to_thread from async code.
     
     Args:
         password: Plain text password
@@ -94,6 +104,8 @@ def create_refresh_token(subject: Union[str, Any], expires_delta: Optional[timed
 def decode_token(token: str) -> Optional[dict]:
     """
     Decode and validate a JWT token.
+    The signature, expiry and presence of the exp/sub/type claims are all
+    checked by PyJWT.
     
     Args:
         token: JWT token to decode
@@ -102,28 +114,31 @@ def decode_token(token: str) -> Optional[dict]:
         Decoded token payload or None if invalid
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"require": ["exp", "sub", "type"]},
+        )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
-async def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> models.User:
+def get_token_subject(token: str = Depends(oauth2_scheme)) -> str:
     """
-    Dependency to get current authenticated user from JWT token.
+    Dependency to get the subject (user email) of a valid access token.
+    Verified tokens are cached, so repeated requests with the same token
+    skip signature verification. The user itself is not loaded.
     
     Args:
-        db: Database session
         token: JWT token from request
         
     Returns:
-        Current user object
+        Email of the user the token was issued to
         
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If the token is invalid or not an access token
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -131,6 +146,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    token_hash = token_cache.hash_token(token)
+    email = token_cache.get_subject(token_hash)
+    if email is not None:
+        return email
+    
     payload = decode_token(token)
     if payload is None:
         raise credentials_exception
@@ -144,14 +164,39 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    email: str = payload.get("sub")
+    email = payload.get("sub")
     if email is None:
         raise credentials_exception
+    token_cache.store(token_hash, email, expires_at=payload["exp"])
+    return email
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    email: str = Depends(get_token_subject),
+) -> models.User:
+    """
+    Dependency to get current authenticated user from JWT token.
+    The user is always loaded from the database, so deactivation and
+    deletion take effect on the next request.
     
-    user = crud.crud_user.get_user_by_email(db, email=email)
+    Args:
+        db: Database session
+        email: Subject of the verified access token
+        
+    Returns:
+        Current user object
+        
+    Raises:
+        HTTPException: If the user no longer exists
+    """
+    user = await crud.crud_user.get_user_by_email(db, email=email)
     if user is None:
-        raise credentials_exception
-    
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
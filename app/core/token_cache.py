@@ -0,0 +1,78 @@
+"""
+In-process cache of verified access tokens.
+Maps the SHA-256 digest of a bearer token to the subject of its verified claims,
+so repeated requests with the same token skip JWT verification.
+
+Only the token's own claims are cached, never the user: they cannot change for
+the lifetime of the token, so the cache needs no invalidation and stays correct
+across worker processes. The user is still looked up on every request.
+"""
+import hashlib
+import threading
+import time
+from typing import Optional, Tuple
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+
+# token hash -> (subject claim, unix timestamp at which the token expires)
+_cache: "TTLCache[bytes, Tuple[str, float]]" = TTLCache(
+    maxsize=100_000,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+_lock = threading.Lock()
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Compute the cache key for a bearer token.
+
+    Args:
+        token: Encoded JWT token
+
+    Returns:
+        SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_subject(token_hash: bytes) -> Optional[str]:
+    """
+    Look up the subject cached for a verified access token.
+
+    Args:
+        token_hash: Digest returned by hash_token
+
+    Returns:
+        Subject claim (user email) or None on a miss or if the token has expired
+    """
+    with _lock:
+        entry = _cache.get(token_hash)
+        if entry is None:
+            return None
+        subject, expires_at = entry
+        if expires_at <= time.time():
+            del _cache[token_hash]
+            return None
+        return subject
+
+
+def store(token_hash: bytes, subject: str, expires_at: float) -> None:
+    """
+    Cache the subject of a successfully verified access token.
+    Only call this after the token signature and claims have been validated.
+
+    Args:
+        token_hash: Digest returned by hash_token
+        subject: Subject claim of the token (user email)
+        expires_at: Token expiry as a unix timestamp (the "exp" claim)
+    """
+    with _lock:
+        _cache[token_hash] = (subject, expires_at)
+
+
+def clear() -> None:
+    """Remove all cached tokens."""
+    with _lock:
+        _cache.clear()
@@ -2,14 +2,25 @@
 CRUD operations for Item model.
 Provides database operations for item management with ownership verification.
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Optional, List, Tuple
+from sqlalchemy import bindparam, delete, func, insert, lambda_stmt, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.models.item import Item
+from app.models.user import User
 from app.schemas.item import ItemCreate, ItemUpdate
 
+# Load options for item lists: responses never include the owner, so nothing
+# else is loaded and any lazy load raises instead of issuing one query per row
+_LIST_LOAD_OPTIONS = (raiseload("*"),)
 
-def get_item(db: Session, item_id: int) -> Optional[Item]:
+# Hot lookup (item reads): built and compiled once, only the parameter is
+# bound per call
+_ITEM_BY_ID = lambda_stmt(lambda: select(Item).where(Item.id == bindparam("item_id")))
+
+
+async def get_item(db: AsyncSession, item_id: int) -> Optional[Item]:
     """
     Get item by ID.
     
@@ -20,52 +31,109 @@ def get_item(db: Session, item_id: int) -> Optional[Item]:
     Returns:
         Item object or None if not found
     """
-    return db.query(Item).filter(Item.id == item_id).first()
+    result = await db.execute(_ITEM_BY_ID, {"item_id": item_id})
+    return result.scalar_one_or_none()
 
 
-def get_items(
-    db: Session,
-    skip: int = 0,
-    limit: int = 100,
-    owner_id: Optional[int] = None
-) -> List[Item]:
+async def item_exists(db: AsyncSession, item_id: int) -> bool:
     """
-    Get list of items with pagination and optional filtering by owner.
+    Check whether an item exists without loading the row.
     
     Args:
         db: Database session
-        skip: Number of records to skip
-        limit: Maximum number of records to return
+        item_id: Item ID
+        
+    Returns:
+        True if the item exists, False otherwise
+    """
+    result = await db.execute(select(literal(1)).where(Item.id == item_id))
+    return result.scalar_one_or_none() is not None
+
+
+def _writable_by(item_id: int, actor_id: int, is_superuser: bool) -> tuple:
+    """
+    Build the WHERE criteria matching an item the actor may modify.
+    Superusers may modify any item, other users only their own.
+    
+    Args:
+        item_id: Item ID
+        actor_id: ID of the user performing the change
+        is_superuser: Whether the actor is a superuser
+        
+    Returns:
+        Tuple of WHERE clause criteria
+    """
+    return (Item.id == item_id, or_(Item.owner_id == actor_id, literal(is_superuser)))
+
+
+def _filter_items(
+    stmt, owner_id: Optional[int], after_id: Optional[int], owner_email: Optional[str] = None
+):
+    """
+    Apply the optional owner and keyset cursor filters to an items query.
+    
+    Args:
+        stmt: Select statement over items
         owner_id: Optional filter by owner ID
+        after_id: Optional keyset cursor; only items with a greater ID are kept
+        owner_email: Optional filter by the email of an active owner, resolved
+            in the same statement
         
     Returns:
-        List of items
+        Filtered select statement
     """
-    query = db.query(Item)
     if owner_id is not None:
-        query = query.filter(Item.owner_id == owner_id)
-    return query.offset(skip).limit(limit).all()
+        stmt = stmt.where(Item.owner_id == owner_id)
+    if owner_email is not None:
+        owner = select(User.id).where(User.email == owner_email, User.is_active)
+        stmt = stmt.where(Item.owner_id == owner.scalar_subquery())
+    if after_id is not None:
+        stmt = stmt.where(Item.id > after_id)
+    return stmt
 
 
-def get_items_by_owner(db: Session, owner_id: int, skip: int = 0, limit: int = 100) -> List[Item]:
+async def get_items_page(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    owner_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    owner_email: Optional[str] = None,
+) -> Tuple[List[Item], int]:
     """
-    Get all items owned by a specific user.
+    Get a page of items ordered by ID together with the total number of matching items.
+    The total is computed with a count(*) OVER () window in the same query.
     
     Args:
         db: Database session
-        owner_id: Owner user ID
         skip: Number of records to skip
         limit: Maximum number of records to return
+        owner_id: Optional filter by owner ID
+        after_id: Optional keyset cursor; only items with a greater ID are returned
+        owner_email: Optional filter by the email of an active owner
         
     Returns:
-        List of items owned by the user
+        Tuple of (items, total count of items matching the filters)
     """
-    return db.query(Item).filter(Item.owner_id == owner_id).offset(skip).limit(limit).all()
+    stmt = select(Item, func.count().over().label("total")).options(*_LIST_LOAD_OPTIONS)
+    stmt = _filter_items(stmt, owner_id, after_id, owner_email)
+    result = await db.execute(stmt.order_by(Item.id).offset(skip).limit(limit))
+    rows = result.all()
+    if rows:
+        return [row.Item for row in rows], rows[0].total
+    
+    # An empty page carries no total; count separately only if rows were
+    # skipped or none were requested
+    if skip == 0 and limit > 0:
+        return [], 0
+    return [], await count_items(
+        db, owner_id=owner_id, after_id=after_id, owner_email=owner_email
+    )
 
 
-def create_item(db: Session, item: ItemCreate, owner_id: int) -> Item:
+async def create_item(db: AsyncSession, item: ItemCreate, owner_id: int) -> Item:
     """
-    Create a new item.
+    Create a new item with a single INSERT ... RETURNING statement.
     
     Args:
         db: Database session
@@ -75,91 +143,135 @@ def create_item(db: Session, item: ItemCreate, owner_id: int) -> Item:
     Returns:
         Created item object
     """
-    db_item = Item(
+    stmt = insert(Item).values(
         title=item.title,
         description=item.description,
         owner_id=owner_id,
-    )
-    db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+    ).returning(Item)
+    result = await db.execute(stmt)
+    db_item = result.scalar_one()
+    await db.commit()
     return db_item
 
 
-def update_item(
-    db: Session,
+async def create_items_bulk(db: AsyncSession, items: List[ItemCreate], owner_id: int) -> List[Item]:
+    """
+    Create several items with one multi-row INSERT ... RETURNING statement.
+    
+    Args:
+        db: Database session
+        items: Item creation schemas
+        owner_id: ID of the user who owns the items
+        
+    Returns:
+        Created item objects, in the same order as the input
+    """
+    if not items:
+        return []
+    
+    # On PostgreSQL the rows go out as one batched INSERT whose RETURNING rows are
+    # matched back to the input order; SQLite falls back to one INSERT per row
+    stmt = insert(Item).returning(Item, sort_by_parameter_order=True)
+    result = await db.scalars(
+        stmt,
+        [
+            {"title": item.title, "description": item.description, "owner_id": owner_id}
+            for item in items
+        ],
+    )
+    db_items = list(result.all())
+    await db.commit()
+    return db_items
+
+
+async def update_item(
+    db: AsyncSession,
     item_id: int,
     item_update: ItemUpdate,
-    owner_id: Optional[int] = None
+    actor_id: int,
+    is_superuser: bool = False,
 ) -> Optional[Item]:
     """
-    Update item information.
-    Optionally verify ownership before updating.
+    Update item information with a single UPDATE ... RETURNING statement.
+    Ownership is verified as part of the WHERE clause.
     
     Args:
         db: Database session
         item_id: Item ID to update
         item_update: Item update schema
-        owner_id: Optional owner ID for ownership verification
+        actor_id: ID of the user performing the update
+        is_superuser: Whether the actor may update items they don't own
         
     Returns:
         Updated item object or None if not found or not authorized
     """
-    db_item = get_item(db, item_id)
-    if not db_item:
-        return None
-    
-    # Verify ownership if owner_id is provided
-    if owner_id is not None and db_item.owner_id != owner_id:
-        return None
-    
     update_data = item_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_item, field, value)
+    criteria = _writable_by(item_id, actor_id, is_superuser)
+    
+    # Nothing to change: return the current row
+    if not update_data:
+        result = await db.execute(select(Item).where(*criteria))
+        return result.scalar_one_or_none()
     
-    db.commit()
-    db.refresh(db_item)
+    stmt = (
+        update(Item)
+        .where(*criteria)
+        .values(**update_data)
+        .returning(Item)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    db_item = result.scalar_one_or_none()
+    await db.commit()
     return db_item
 
 
-def delete_item(db: Session, item_id: int, owner_id: Optional[int] = None) -> bool:
+async def delete_item(
+    db: AsyncSession,
+    item_id: int,
+    actor_id: int,
+    is_superuser: bool = False,
+) -> bool:
     """
-    Delete an item.
-    Optionally verify ownership before deleting.
+    Delete an item with a single DELETE ... RETURNING statement.
+    Ownership is verified as part of the WHERE clause.
     
     Args:
         db: Database session
         item_id: Item ID to delete
-        owner_id: Optional owner ID for ownership verification
+        actor_id: ID of the user performing the delete
+        is_superuser: Whether the actor may delete items they don't own
         
     Returns:
         True if deleted, False if not found or not authorized
     """
-    db_item = get_item(db, item_id)
-    if not db_item:
-        return False
-    
-    # Verify ownership if owner_id is provided
-    if owner_id is not None and db_item.owner_id != owner_id:
-        return False
-    
-    db.delete(db_item)
-    db.commit()
-    return True
+    stmt = delete(Item).where(*_writable_by(item_id, actor_id, is_superuser))
+    result = await db.execute(stmt.returning(Item.id))
+    deleted_id = result.scalar_one_or_none()
+    await db.commit()
+    return deleted_id is not None
 
 
-def count_items(db: Session, owner_id: Optional[int] = None) -> int:
+async def count_items(
+    db: AsyncSession,
+    owner_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    owner_email: Optional[str] = None,
+) -> int:
     """
     Count total number of items, optionally filtered by owner.
     
     Args:
         db: Database session
         owner_id: Optional filter by owner ID
+        after_id: Optional keyset cursor; only items with a greater ID are counted
+        owner_email: Optional filter by the email of an active owner
         
     Returns:
         Total count of items
     """
-    query = db.query(Item)
-    if owner_id is not None:
-        query = query.filter(Item.owner_id == owner_id)
-    return query.count()
+    stmt = _filter_items(
+        select(func.count()).select_from(Item), owner_id, after_id, owner_email
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one()
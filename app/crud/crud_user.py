@@ -2,15 +2,37 @@
 CRUD operations for User model.
 Provides database operations for user management and authentication.
 """
+import asyncio
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, insert, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
 
+# Hot lookup (every authenticated request): built and compiled once, only
+# the parameter is bound per call
+_USER_BY_EMAIL = lambda_stmt(lambda: select(User).where(User.email == bindparam("email")))
 
-def get_user(db: Session, user_id: int) -> Optional[User]:
+
+def is_duplicate_email(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error is a violation of the unique email index.
+    
+    Args:
+        error: Error raised by a failed INSERT or UPDATE on users
+        
+    Returns:
+        True if another user already has the email
+    """
+    # PostgreSQL names the index, SQLite the column
+    message = str(error.orig)
+    return "ix_users_email" in message or "users.email" in message
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
     """
     Get user by ID.
     
@@ -21,10 +43,11 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
     Returns:
         User object or None if not found
     """
-    return db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    return result.scalar_one_or_none()
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """
     Get user by email address.
     
@@ -35,27 +58,35 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     Returns:
         User object or None if not found
     """
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(_USER_BY_EMAIL, {"email": email})
+    return result.scalar_one_or_none()
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
+async def get_users(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+) -> List[User]:
     """
-    Get list of users with pagination.
+    Get list of users ordered by ID with pagination.
     
     Args:
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after_id: Optional keyset cursor; only users with a greater ID are returned
         
     Returns:
         List of users
     """
-    return db.query(User).offset(skip).limit(limit).all()
+    stmt = select(User)
+    if after_id is not None:
+        stmt = stmt.where(User.id > after_id)
+    result = await db.execute(stmt.order_by(User.id).offset(skip).limit(limit))
+    return list(result.scalars().all())
 
 
-def create_user(db: Session, user: UserCreate) -> User:
+async def create_user(db: AsyncSession, user: UserCreate) -> User:
     """
-    Create a new user with hashed password.
+    Create a new user with hashed password in a single INSERT ... RETURNING statement.
     
     Args:
         db: Database session
@@ -64,22 +95,24 @@ def create_user(db: Session, user: UserCreate) -> User:
     Returns:
         Created user object
     """
-    hashed_password = get_password_hash(user.password)
-    db_user = User(
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
+    stmt = insert(User).values(
         email=user.email,
         hashed_password=hashed_password,
         full_name=user.full_name,
         is_active=user.is_active,
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    ).returning(User)
+    result = await db.execute(stmt)
+    db_user = result.scalar_one()
+    await db.commit()
     return db_user
 
 
-def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[User]:
+async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate) -> Optional[User]:
     """
-    Update user information.
+    Update user information with a single UPDATE ... RETURNING statement.
+    The returned row includes the server-generated updated_at, so nothing
+    has to be refreshed after the commit.
     
     Args:
         db: Database session
@@ -89,27 +122,32 @@ def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[
     Returns:
         Updated user object or None if not found
     """
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return None
-    
     update_data = user_update.model_dump(exclude_unset=True)
     
     # Hash password if it's being updated
     if "password" in update_data:
-        hashed_password = get_password_hash(update_data["password"])
+        hashed_password = await asyncio.to_thread(get_password_hash, update_data["password"])
         del update_data["password"]
         update_data["hashed_password"] = hashed_password
     
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
+    # Nothing to change: return the current row
+    if not update_data:
+        return await get_user(db, user_id)
     
-    db.commit()
-    db.refresh(db_user)
+    stmt = (
+        update(User)
+        .where(User.id == user_id)
+        .values(**update_data)
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    db_user = result.scalar_one_or_none()
+    await db.commit()
     return db_user
 
 
-def delete_user(db: Session, user_id: int) -> bool:
+async def delete_user(db: AsyncSession, user_id: int) -> bool:
     """
     Delete a user.
     
@@ -120,16 +158,16 @@ def delete_user(db: Session, user_id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db_user = get_user(db, user_id)
+    db_user = await get_user(db, user_id)
     if not db_user:
         return False
     
-    db.delete(db_user)
-    db.commit()
+    await db.delete(db_user)
+    await db.commit()
     return True
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     """
     Authenticate user with email and password.
     
@@ -141,17 +179,18 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     Returns:
         User object if authentication successful, None otherwise
     """
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    # Run the hash off the event loop so other requests are not stalled
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         return None
     return user
 
 
-def create_superuser(db: Session, email: str, password: str, full_name: str = None) -> User:
+async def create_superuser(db: AsyncSession, email: str, password: str, full_name: str = None) -> User:
     """
-    Create a superuser account.
+    Create a superuser account in a single INSERT ... RETURNING statement.
     
     Args:
         db: Database session
@@ -162,15 +201,15 @@ def create_superuser(db: Session, email: str, password: str, full_name: str = No
     Returns:
         Created superuser object
     """
-    hashed_password = get_password_hash(password)
-    db_user = User(
+    hashed_password = await asyncio.to_thread(get_password_hash, password)
+    stmt = insert(User).values(
         email=email,
         hashed_password=hashed_password,
         full_name=full_name,
         is_active=True,
         is_superuser=True,
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    ).returning(User)
+    result = await db.execute(stmt)
+    db_user = result.scalar_one()
+    await db.commit()
     return db_user
@@ -0,0 +1,30 @@
+"""
+Initial data setup.
+Creates the first superuser; run once per deployment, not per worker.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.config import settings
+
+
+async def init_db(db: AsyncSession) -> None:
+    """
+    Create the initial superuser if it doesn't exist.
+
+    Args:
+        db: Database session
+    """
+    # Emails are stored lowercased
+    email = settings.FIRST_SUPERUSER_EMAIL.lower()
+    user = await crud.crud_user.get_user_by_email(db, email=email)
+    if not user:
+        await crud.crud_user.create_superuser(
+            db,
+            email=email,
+            password=settings.FIRST_SUPERUSER_PASSWORD,
+            full_name="Admin User"
+        )
+        print(f"✅ Created superuser: {settings.FIRST_SUPERUSER_EMAIL}")
+    else:
+        print(f"ℹ️  Superuser already exists: {settings.FIRST_SUPERUSER_EMAIL}")
@@ -0,0 +1,44 @@
+"""
+Schema migrations.
+Brings the database to the latest Alembic revision; shared by the bootstrap
+script and the optional startup bootstrap. Run from the project root.
+
+Databases created by create_all before Alembic was introduced have the tables
+but no alembic_version table; they are stamped at the initial revision first,
+and the later migrations bring them up to date.
+"""
+import asyncio
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+
+# Revision matching the schema that create_all built before Alembic was used
+UNVERSIONED_SCHEMA_REVISION = "a8b060719ed0"
+
+
+async def has_unversioned_schema() -> bool:
+    """Check whether the tables exist but were never stamped by Alembic."""
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        async with engine.connect() as conn:
+            tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    finally:
+        await engine.dispose()
+    return "users" in tables and "alembic_version" not in tables
+
+
+def upgrade_database() -> None:
+    """
+    Apply all migrations, adopting a pre-Alembic schema first if needed.
+    Blocking: runs its own event loop, so call it from a worker thread
+    when an event loop is already running.
+    """
+    config = Config("alembic.ini")
+    if asyncio.run(has_unversioned_schema()):
+        print(f"ℹ️  Stamping existing schema at revision {UNVERSIONED_SCHEMA_REVISION}")
+        command.stamp(config, UNVERSIONED_SCHEMA_REVISION)
+    command.upgrade(config, "head")
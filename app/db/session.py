@@ -1,43 +1,87 @@
 """
 Database session management.
-Provides database engine, session factory, and dependency for FastAPI routes.
+Provides async database engine, session factory, and dependency for FastAPI routes.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from datetime import datetime, timezone
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from typing import AsyncGenerator
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
+# Connection pool sizing (SQLite uses its own single-connection pools).
+# Each worker process has its own pool, so workers * (pool size + overflow)
+# must stay below the database's max_connections. Connections are recycled
+# instead of pinged before every checkout, which saves a round trip per request.
+engine_options = {}
+if "sqlite" not in settings.DATABASE_URL.lower():
+    engine_options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+if "asyncpg" in settings.DATABASE_URL.lower():
+    # asyncpg prepares each distinct statement once per connection and reuses it
+    engine_options["connect_args"] = {
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+# Create async SQLAlchemy engine (postgresql+asyncpg://...)
+# The engine owns the connection pool for the lifetime of the application
+engine = create_async_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,  # Enable connection health checks
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # Ping on checkout (off: relies on pool_recycle)
     echo=False,  # Set to True for SQL query logging in development
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Bounded LRU of compiled SQL shared by all sessions
+    **engine_options,
 )
 
-# Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Base class for SQLAlchemy models
-Base = declarative_base()
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Turn on foreign key enforcement (and ON DELETE CASCADE) for a SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if "sqlite" in settings.DATABASE_URL.lower():
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+
+# Create SessionLocal factory for async database sessions
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
+class Base(DeclarativeBase):
+    """Base class for SQLAlchemy models (2.0 typed declarative mapping)."""
 
-def get_db() -> Generator[Session, None, None]:
+
+def utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency function to get database session.
+    Dependency function to get an async database session.
     Yields a database session and ensures it's closed after use.
     
+    FastAPI caches dependencies per request, so the endpoint and the
+    authentication dependencies share this one session and hold at most
+    one pooled connection per request.
+    
     Usage:
         @app.get("/items/")
-        def read_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def read_items(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
     
     Yields:
-        Database session
+        Async database session
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
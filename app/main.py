@@ -1,55 +1,65 @@
 """
 FastAPI main application.
 Entry point for the API with middleware, routers, and startup events.
+
+In production run it under Gunicorn with Uvicorn workers:
+
+    gunicorn -c gunicorn_conf.py app.main:app
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.api_v1.api import api_router
 from app.core.config import settings
+from app.core import response_cache
+from app.core.cors import CORSMiddleware
 from app.db.session import engine
-from app.db.base import Base
-from app import crud
+from app.db.init_db import init_db
+from app.db.migrations import upgrade_database
 from app.db.session import SessionLocal
-from app.schemas.user import UserCreate
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+async def bootstrap_db() -> None:
     """
-    Lifespan context manager for startup and shutdown events.
-    Creates database tables and initial superuser on startup.
+    Apply the migrations and create the initial superuser.
+    Only used when RUN_STARTUP_BOOTSTRAP is enabled (single-process setups);
+    deployments run scripts/bootstrap.py once instead.
     """
-    # Startup: Create tables
-    Base.metadata.create_all(bind=engine)
+    # Alembic runs its own event loop, so migrate from a worker thread
+    await asyncio.to_thread(upgrade_database)
     
-    # Create initial superuser if it doesn't exist (skip in test mode)
-    if "sqlite" not in settings.DATABASE_URL.lower():
-        db = SessionLocal()
+    async with SessionLocal() as db:
         try:
-            user = crud.crud_user.get_user_by_email(db, email=settings.FIRST_SUPERUSER_EMAIL)
-            if not user:
-                crud.crud_user.create_superuser(
-                    db,
-                    email=settings.FIRST_SUPERUSER_EMAIL,
-                    password=settings.FIRST_SUPERUSER_PASSWORD,
-                    full_name="Admin User"
-                )
-                print(f"✅ Created superuser: {settings.FIRST_SUPERUSER_EMAIL}")
-            else:
-                print(f"ℹ️  Superuser already exists: {settings.FIRST_SUPERUSER_EMAIL}")
+            await init_db(db)
         except Exception as e:
             print(f"⚠️  Error creating superuser: {e}")
-        finally:
-            db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for startup and shutdown events.
+    Verifies database connectivity on startup (or bootstraps the database
+    when RUN_STARTUP_BOOTSTRAP is set) and connects the response cache.
+    Disposes the connection pool and cache connections on shutdown.
+    """
+    # Startup: no per-worker DDL, just make sure the database is reachable
+    if settings.RUN_STARTUP_BOOTSTRAP:
+        await bootstrap_db()
+    else:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await response_cache.init()
     
     yield
     
-    # Shutdown: cleanup if needed
-    pass
+    # Shutdown: close all pooled connections
+    await response_cache.close()
+    await engine.dispose()
 
 
 # Create FastAPI application
@@ -86,13 +96,14 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -103,7 +114,7 @@ if settings.BACKEND_CORS_ORIGINS:
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
     """Handle SQLAlchemy database errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Database error occurred. Please try again later."},
     )
@@ -140,3 +151,10 @@ async def root():
         "redoc": "/redoc",
         "health": "/health",
     }
+
+
+# Build the OpenAPI schema now rather than on the first /docs or /openapi.json
+# request. Pydantic validators and serializers are already compiled when the
+# schema classes are defined; with Gunicorn's preload_app this happens once in
+# the master process and is shared by all workers.
+app.openapi()
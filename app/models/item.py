@@ -2,11 +2,17 @@
 Item database model.
 Represents items owned by users.
 """
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import String, Text, ForeignKey, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from app.db.session import Base
+from app.db.session import Base, utcnow
+
+if TYPE_CHECKING:
+    from app.models.user import User
 
 
 class Item(Base):
@@ -23,16 +29,25 @@ class Item(Base):
         owner: Relationship to user who owns this item
     """
     __tablename__ = "items"
+    __table_args__ = (
+        # Serves owner-filtered pages ordered by ID (keyset pagination)
+        Index("ix_items_owner_id_id", "owner_id", "id"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True, nullable=False)
-    description = Column(Text, nullable=True)
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    title: Mapped[str] = mapped_column(String)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Stamped in Python and sent as a bound parameter, so no server-side now()
+    # runs per written row; the server default only covers rows written outside the app
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, server_default=func.now()
+    )
     
-    # Relationship to owner
-    owner = relationship("User", back_populates="items")
+    # Relationship to owner: never lazy loaded, so per-row access can't turn
+    # into N+1 queries; load it at the query site with selectinload(Item.owner)
+    owner: Mapped["User"] = relationship(back_populates="items", lazy="raise")
     
     def __repr__(self):
         return f"<Item(id={self.id}, title={self.title}, owner_id={self.owner_id})>"
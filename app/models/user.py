@@ -2,11 +2,17 @@
 User database model.
 Represents users in the system with authentication and profile information.
 """
-from sqlalchemy import Boolean, Column, Integer, String, DateTime
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from app.db.session import Base
+from app.db.session import Base, utcnow
+
+if TYPE_CHECKING:
+    from app.models.item import Item
 
 
 class User(Base):
@@ -26,17 +32,27 @@ class User(Base):
     """
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    hashed_password = Column(String, nullable=False)
-    full_name = Column(String, nullable=True)
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_superuser = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True)
+    hashed_password: Mapped[str] = mapped_column(String)
+    full_name: Mapped[Optional[str]] = mapped_column(String)
+    is_active: Mapped[bool] = mapped_column(default=True)
+    is_superuser: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Stamped in Python and sent as a bound parameter, so no server-side now()
+    # runs per written row; the server default only covers rows written outside the app
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, server_default=func.now()
+    )
     
-    # Relationship to items
-    items = relationship("Item", back_populates="owner", cascade="all, delete-orphan")
+    # Relationship to items: never lazy loaded (query items explicitly), and
+    # deleting a user leaves removing the items to the ON DELETE CASCADE key
+    items: Mapped[List["Item"]] = relationship(
+        back_populates="owner",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
+    )
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
@@ -1,8 +1,8 @@
 """
 Export all schemas for easy importing.
 """
-from app.schemas.user import User, UserCreate, UserUpdate, UserInDB
-from app.schemas.item import Item, ItemCreate, ItemUpdate
+from app.schemas.user import User, UserCreate, UserUpdate, UserInDB, USER_LIST_ADAPTER
+from app.schemas.item import Item, ItemCreate, ItemUpdate, ITEM_LIST_ADAPTER
 from app.schemas.token import Token, TokenRefresh, TokenData
 
 __all__ = [
@@ -10,9 +10,11 @@ __all__ = [
     "UserCreate",
     "UserUpdate",
     "UserInDB",
+    "USER_LIST_ADAPTER",
     "Item",
     "ItemCreate",
     "ItemUpdate",
+    "ITEM_LIST_ADAPTER",
     "Token",
     "TokenRefresh",
     "TokenData",
@@ -0,0 +1,42 @@
+"""
+Helpers shared by the response schemas.
+"""
+from typing import Any, Dict, Iterable, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def row_to_dict(obj: Any, fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Read already loaded column values from an ORM object.
+    Slices the instance __dict__ instead of going through the attribute descriptors.
+    
+    Args:
+        obj: Loaded SQLAlchemy model instance
+        fields: Names of the attributes to read
+        
+    Returns:
+        Mapping of field name to value
+    """
+    values = obj.__dict__
+    return {name: values[name] for name in fields}
+
+
+class FromRowMixin:
+    """Adds from_row to response schemas built from ORM rows."""
+    
+    @classmethod
+    def from_row(cls: Type[ModelT], obj: Any) -> ModelT:
+        """
+        Build the schema from a loaded model row without validation.
+        Safe because the values come from the database.
+        
+        Args:
+            obj: Loaded SQLAlchemy model instance
+            
+        Returns:
+            Schema instance
+        """
+        return cls.model_construct(**row_to_dict(obj, cls.model_fields))
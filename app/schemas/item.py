@@ -2,9 +2,11 @@
 Pydantic schemas for Item model.
 Used for request/response validation and serialization.
 """
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.base import FromRowMixin
 
 if TYPE_CHECKING:
     from app.schemas.user import User
@@ -27,18 +29,22 @@ class ItemUpdate(BaseModel):
     description: Optional[str] = None
 
 
-class ItemInDBBase(ItemBase):
+class ItemInDBBase(FromRowMixin, ItemBase):
     """Base schema for item in database."""
+    # Response-only: instances are never modified after from_row
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     owner_id: int
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class Item(ItemInDBBase):
     """Schema for item response with owner information."""
     pass
 
+
+# Serializer for item list responses, built once at import time
+ITEM_LIST_ADAPTER = TypeAdapter(List[Item])
+
@@ -2,14 +2,27 @@
 Pydantic schemas for User model.
 Used for request/response validation and serialization.
 """
-from typing import Optional
+from typing import Annotated, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+
+from app.schemas.base import FromRowMixin
+
+# Email address checked by a regex in pydantic-core and stored lowercased
+Email = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    ),
+]
 
 
 class UserBase(BaseModel):
     """Base user schema with common attributes."""
-    email: EmailStr
+    email: Email
     full_name: Optional[str] = None
     is_active: bool = True
 
@@ -21,21 +34,23 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     """Schema for updating user information."""
-    email: Optional[EmailStr] = None
+    # Omitted fields are left unchanged; only full_name may be set to null,
+    # the other columns are NOT NULL
+    email: Email = None
     full_name: Optional[str] = None
-    password: Optional[str] = Field(None, min_length=6)
-    is_active: Optional[bool] = None
+    password: str = Field(None, min_length=6)
+    is_active: bool = None
 
 
-class UserInDBBase(UserBase):
+class UserInDBBase(FromRowMixin, UserBase):
     """Base schema for user in database."""
+    # Response-only: instances are never modified after from_row
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     is_superuser: bool = False
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class User(UserInDBBase):
@@ -43,6 +58,10 @@ class User(UserInDBBase):
     pass
 
 
+# Serializer for user list responses, built once at import time
+USER_LIST_ADAPTER = TypeAdapter(List[User])
+
+
 class UserInDB(UserInDBBase):
     """Schema for user in database with hashed password."""
     hashed_password: str
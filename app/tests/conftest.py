@@ -2,87 +2,164 @@
 Test configuration and fixtures.
 Provides shared test fixtures for database and authentication.
 """
+import asyncio
 import os
 import pytest
-from typing import Generator
+import pytest_asyncio
+from typing import AsyncGenerator, Generator, List
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-# Set test database URL before importing app
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+# Set test database URL and minimal password hashing cost before importing app
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
+os.environ["PASSWORD_HASH_TIME_COST"] = "1"
+os.environ["PASSWORD_HASH_MEMORY_COST"] = "8"
 
 from app.main import app
-from app.db.session import Base, get_db
-from app.core.config import settings
+from app.db.session import Base, enable_sqlite_foreign_keys, get_db
+from app.core import response_cache, security, token_cache
 from app import crud, schemas
 
-# Test database URL (using SQLite for testing)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Exercise the response cache with an in-process backend
+cache_backend = response_cache.MemoryBackend()
+response_cache.configure(cache_backend)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+# Test database URL (in-memory SQLite, one connection shared by the whole run)
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite://"
+
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+TestingSessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# User created once with the schema and shared by all tests
+TEST_USER = {
+    "email": "test@example.com",
+    "password": "testpassword123",
+    "full_name": "Test User"
+}
 
-@pytest.fixture(scope="function")
-def db() -> Generator[Session, None, None]:
+# Transaction control statements, not counted by query_counter
+TRANSACTION_STATEMENTS = ("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK")
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Stop the sqlite3 driver from issuing BEGIN itself, so SAVEPOINTs work."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def begin_sqlite_transaction(conn):
+    """Emit BEGIN explicitly now that the driver no longer does."""
+    conn.exec_driver_sql("BEGIN")
+
+
+async def create_schema() -> None:
+    """Create all tables and the shared test user in the in-memory database."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with TestingSessionLocal() as db:
+        await crud.crud_user.create_user(db, user=schemas.UserCreate(**TEST_USER))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema() -> None:
+    """
+    Create the schema and the test user once for the whole test run.
+    """
+    asyncio.run(create_schema())
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a session inside a transaction that is rolled back after each test.
+    Commits made by the code under test only release SAVEPOINTs.
+    """
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        async with TestingSessionLocal(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as db:
+            yield db
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def app_client(schema: None) -> Generator[TestClient, None, None]:
     """
-    Create a fresh database for each test.
+    Create the test client once, so the app's lifespan runs once per test run.
     """
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db: Session) -> Generator[TestClient, None, None]:
+def client(app_client: TestClient, db: AsyncSession) -> Generator[TestClient, None, None]:
     """
-    Create a test client with database dependency override.
+    Provide the shared test client with the database dependency overridden
+    to use this test's session.
     """
-    def override_get_db():
+    async def override_get_db():
         try:
             yield db
         finally:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     app.dependency_overrides.clear()
+    app_client.cookies.clear()
+    token_cache.clear()
+    cache_backend.clear()
 
 
 @pytest.fixture(scope="function")
-def test_user(db: Session) -> dict:
+def response_cache_backend() -> response_cache.MemoryBackend:
     """
-    Create a test user and return user data with password.
+    Return the in-memory response cache backend used by the app under test.
     """
-    user_data = {
-        "email": "test@example.com",
-        "password": "testpassword123",
-        "full_name": "Test User"
-    }
-    user_in = schemas.UserCreate(**user_data)
-    crud.crud_user.create_user(db, user=user_in)
-    return user_data
+    return cache_backend
 
 
 @pytest.fixture(scope="function")
-def auth_headers(client: TestClient, test_user: dict) -> dict:
-    """
-    Get authentication headers with valid access token.
-    """
-    response = client.post(
-        f"{settings.API_V1_STR}/auth/login",
-        data={
-            "username": test_user["email"],
-            "password": test_user["password"]
-        }
-    )
-    tokens = response.json()
-    return {"Authorization": f"Bearer {tokens['access_token']}"}
+def query_counter() -> Generator[List[str], None, None]:
+    """
+    Record the SQL statements executed on the test engine.
+    """
+    statements: List[str] = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(TRANSACTION_STATEMENTS):
+            statements.append(statement)
+    
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="session")
+def test_user(schema: None) -> dict:
+    """
+    Return the shared test user's data with password.
+    Changes a test makes to the user are rolled back with its transaction.
+    """
+    return dict(TEST_USER)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user: dict) -> dict:
+    """
+    Get authentication headers with a valid access token for the test user.
+    The token is issued directly, so no password verification is needed.
+    """
+    access_token = security.create_access_token(subject=test_user["email"])
+    return {"Authorization": f"Bearer {access_token}"}
@@ -1,11 +1,15 @@
 """
 Tests for authentication endpoints.
 """
+from datetime import datetime, timedelta
+
+import jwt
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app import crud
+from app.core.security import decode_token
 
 
 def test_register_user(client: TestClient, db: Session):
@@ -124,3 +128,45 @@ def test_test_token(client: TestClient, auth_headers: dict):
     data = response.json()
     assert "email" in data
     assert "id" in data
+
+
+def test_token_missing_required_claim(client: TestClient, test_user: dict):
+    """Test that a correctly signed token without a type claim is rejected."""
+    token = jwt.encode(
+        {"sub": test_user["email"], "exp": datetime.utcnow() + timedelta(minutes=5)},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+    assert decode_token(token) is None
+    
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/test-token",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 401
+
+
+def test_register_normalizes_email(client: TestClient):
+    """Test that registered emails are stored lowercased and login ignores case."""
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={"email": " Mixed.Case@Example.COM ", "password": "password123"}
+    )
+    assert response.status_code == 201
+    assert response.json()["email"] == "mixed.case@example.com"
+    
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        data={"username": "MIXED.case@example.com", "password": "password123"}
+    )
+    assert response.status_code == 200
+
+
+def test_register_invalid_email(client: TestClient):
+    """Test that malformed email addresses are rejected."""
+    for email in ("not-an-email", "missing@tld", "two@@example.com", "space in@example.com"):
+        response = client.post(
+            f"{settings.API_V1_STR}/auth/register",
+            json={"email": email, "password": "password123"}
+        )
+        assert response.status_code == 422, email
@@ -0,0 +1,30 @@
+"""
+Tests for CORS configuration parsing and origin checks.
+"""
+from app.core.config import Settings
+from app.core.cors import CORSMiddleware
+
+
+def test_cors_origins_from_comma_separated_env(monkeypatch):
+    """Test that a comma-separated env value is parsed into a tuple."""
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", "http://localhost:3000, http://localhost:8000,")
+    settings = Settings()
+    assert settings.BACKEND_CORS_ORIGINS == ("http://localhost:3000", "http://localhost:8000")
+
+
+def test_cors_origins_from_json_env(monkeypatch):
+    """Test that a JSON list env value is parsed into a tuple."""
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", '["http://localhost:3000"]')
+    settings = Settings()
+    assert settings.BACKEND_CORS_ORIGINS == ("http://localhost:3000",)
+
+
+def test_cors_middleware_allowed_origin():
+    """Test that origins are stored as a frozenset and checked by membership."""
+    middleware = CORSMiddleware(
+        app=None,
+        allow_origins=("http://localhost:3000", "http://localhost:8000"),
+    )
+    assert isinstance(middleware.allow_origins, frozenset)
+    assert middleware.is_allowed_origin("http://localhost:3000")
+    assert not middleware.is_allowed_origin("http://evil.example.com")
@@ -1,11 +1,13 @@
 """
 Tests for item endpoints.
 """
+import pytest
+from datetime import datetime
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.core import response_cache
 from app.core.config import settings
-from app import crud, schemas
 
 
 def test_create_item(client: TestClient, auth_headers: dict):
@@ -41,15 +43,11 @@ def test_create_item_without_auth(client: TestClient):
 def test_read_items(client: TestClient, db: Session, auth_headers: dict):
     """Test reading all items (public endpoint)."""
     # Create some items
-    for i in range(3):
-        client.post(
-            f"{settings.API_V1_STR}/items/",
-            headers=auth_headers,
-            json={
-                "title": f"Item {i}",
-                "description": f"Description {i}"
-            }
-        )
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"Item {i}", "description": f"Description {i}"} for i in range(3)]
+    )
     
     # Read items without auth (public endpoint)
     response = client.get(f"{settings.API_V1_STR}/items/")
@@ -58,18 +56,95 @@ def test_read_items(client: TestClient, db: Session, auth_headers: dict):
     assert len(data) >= 3
 
 
+def test_read_items_query_count(client: TestClient, auth_headers: dict, query_counter: list):
+    """Test that listing items is a single query."""
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"Item {i}"} for i in range(3)]
+    )
+    query_counter.clear()
+    
+    response = client.get(f"{settings.API_V1_STR}/items/")
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert len(query_counter) == 1
+
+
+def test_read_items_keyset_pagination(client: TestClient, auth_headers: dict):
+    """Test paging through items with the after_id cursor."""
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"Item {i}"} for i in range(3)]
+    )
+    
+    first_page = client.get(f"{settings.API_V1_STR}/items/", params={"limit": 2})
+    assert first_page.status_code == 200
+    assert first_page.headers["X-Total-Count"] == "3"
+    assert [item["title"] for item in first_page.json()] == ["Item 0", "Item 1"]
+    cursor = first_page.headers["X-Next-Cursor"]
+    
+    second_page = client.get(
+        f"{settings.API_V1_STR}/items/", params={"limit": 2, "after_id": cursor}
+    )
+    assert second_page.status_code == 200
+    assert [item["title"] for item in second_page.json()] == ["Item 2"]
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_read_items_zero_limit(client: TestClient, auth_headers: dict):
+    """Test that limit=0 returns an empty page with the total and no cursor."""
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"Item {i}"} for i in range(2)]
+    )
+    
+    for path in ("/items/", "/items/my-items"):
+        response = client.get(
+            f"{settings.API_V1_STR}{path}", headers=auth_headers, params={"limit": 0}
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "2"
+        assert "X-Next-Cursor" not in response.headers
+
+
+def test_read_my_items_query_count(client: TestClient, auth_headers: dict, query_counter: list):
+    """Test that an authenticated user's item page, user check included, is a single query."""
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"Item {i}"} for i in range(3)]
+    )
+    query_counter.clear()
+    
+    response = client.get(f"{settings.API_V1_STR}/items/my-items", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert response.headers["X-Total-Count"] == "3"
+    assert len(query_counter) == 1
+
+
+def test_read_my_items_inactive_user(client: TestClient, auth_headers: dict):
+    """Test that a deactivated user can no longer read their items, even from cache."""
+    client.post(f"{settings.API_V1_STR}/items/", headers=auth_headers, json={"title": "Mine"})
+    assert client.get(f"{settings.API_V1_STR}/items/my-items", headers=auth_headers).status_code == 200
+    
+    client.put(f"{settings.API_V1_STR}/users/me", headers=auth_headers, json={"is_active": False})
+    response = client.get(f"{settings.API_V1_STR}/items/my-items", headers=auth_headers)
+    assert response.status_code == 400
+
+
 def test_read_my_items(client: TestClient, auth_headers: dict):
     """Test reading current user's items."""
     # Create items
-    for i in range(2):
-        client.post(
-            f"{settings.API_V1_STR}/items/",
-            headers=auth_headers,
-            json={
-                "title": f"My Item {i}",
-                "description": f"My Description {i}"
-            }
-        )
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"My Item {i}", "description": f"My Description {i}"} for i in range(2)]
+    )
     
     response = client.get(
         f"{settings.API_V1_STR}/items/my-items",
@@ -123,6 +198,19 @@ def test_update_item(client: TestClient, auth_headers: dict):
     data = response.json()
     assert data["title"] == "Updated Title"
     assert data["description"] == "Original Description"
+    assert datetime.fromisoformat(data["updated_at"]) > datetime.fromisoformat(
+        create_response.json()["updated_at"]
+    )
+
+
+def test_update_missing_item(client: TestClient, auth_headers: dict):
+    """Test that updating a non-existent item returns 404."""
+    response = client.put(
+        f"{settings.API_V1_STR}/items/999",
+        headers=auth_headers,
+        json={"title": "Updated Title"}
+    )
+    assert response.status_code == 404
 
 
 def test_update_other_user_item_fails(client: TestClient, db: Session):
@@ -185,6 +273,7 @@ def test_delete_item(client: TestClient, auth_headers: dict):
         headers=auth_headers
     )
     assert response.status_code == 204
+    assert response.content == b""
     
     # Verify item is deleted
     get_response = client.get(f"{settings.API_V1_STR}/items/{item_id}")
@@ -232,3 +321,177 @@ def test_delete_other_user_item_fails(client: TestClient, db: Session):
         headers=headers2
     )
     assert response.status_code == 403
+
+
+def test_delete_missing_item(client: TestClient, auth_headers: dict):
+    """Test that deleting a non-existent item returns 404."""
+    response = client.delete(
+        f"{settings.API_V1_STR}/items/999",
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+def test_read_items_not_modified(client: TestClient, auth_headers: dict):
+    """Test that a matching If-None-Match on the public list returns 304."""
+    client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=auth_headers,
+        json={"title": "Cached Item"}
+    )
+    
+    response = client.get(f"{settings.API_V1_STR}/items/")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "public, max-age=5"
+    
+    cached = client.get(f"{settings.API_V1_STR}/items/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    
+    # A new item changes the page and therefore the ETag
+    client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=auth_headers,
+        json={"title": "Another Item"}
+    )
+    changed = client.get(f"{settings.API_V1_STR}/items/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+
+
+def test_read_item_not_modified(client: TestClient, auth_headers: dict):
+    """Test that a matching If-None-Match on a single item returns 304."""
+    create_response = client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=auth_headers,
+        json={"title": "Cached Item"}
+    )
+    item_id = create_response.json()["id"]
+    
+    response = client.get(f"{settings.API_V1_STR}/items/{item_id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    
+    cached = client.get(
+        f"{settings.API_V1_STR}/items/{item_id}", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+
+def test_read_items_openapi_schema(client: TestClient):
+    """Test that pre-rendered list responses still document their schema."""
+    schema = client.get(f"{settings.API_V1_STR}/openapi.json").json()
+    content = schema["paths"][f"{settings.API_V1_STR}/items/"]["get"]["responses"]["200"]["content"]
+    assert content["application/json"]["schema"]["items"]["$ref"].endswith("/Item")
+
+
+def test_create_items_bulk(client: TestClient, auth_headers: dict):
+    """Test creating several items with one request."""
+    response = client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[{"title": f"Bulk {i}"} for i in range(5)]
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert [item["title"] for item in data] == [f"Bulk {i}" for i in range(5)]
+    assert len({item["id"] for item in data}) == 5
+    
+    response = client.get(f"{settings.API_V1_STR}/items/my-items", headers=auth_headers)
+    assert response.headers["X-Total-Count"] == "5"
+
+
+def test_create_items_bulk_empty(client: TestClient, auth_headers: dict):
+    """Test that an empty bulk create request is rejected."""
+    response = client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=auth_headers,
+        json=[]
+    )
+    assert response.status_code == 422
+
+
+def test_read_items_cached_until_write(client: TestClient, auth_headers: dict, query_counter: list):
+    """Test that repeated list reads are served from cache and writes invalidate it."""
+    create_response = client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=auth_headers,
+        json={"title": "Original"}
+    )
+    item_id = create_response.json()["id"]
+    client.get(f"{settings.API_V1_STR}/items/")
+    query_counter.clear()
+    
+    response = client.get(f"{settings.API_V1_STR}/items/")
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "1"
+    assert query_counter == []
+    
+    client.put(
+        f"{settings.API_V1_STR}/items/{item_id}",
+        headers=auth_headers,
+        json={"title": "Updated"}
+    )
+    response = client.get(f"{settings.API_V1_STR}/items/")
+    assert [item["title"] for item in response.json()] == ["Updated"]
+
+
+def test_read_items_cache_failure_falls_back(
+    client: TestClient,
+    response_cache_backend: response_cache.MemoryBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test that a failing cache backend is logged and the request served from the database."""
+    async def unavailable(namespace: str) -> int:
+        raise ConnectionError("cache down")
+    
+    monkeypatch.setattr(response_cache_backend, "get_generation", unavailable)
+    response = client.get(f"{settings.API_V1_STR}/items/")
+    assert response.status_code == 200
+    assert "Response cache read failed" in caplog.text
+
+
+def test_create_item_cache_invalidation_failure(
+    client: TestClient,
+    auth_headers: dict,
+    response_cache_backend: response_cache.MemoryBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test that a failed cache invalidation is logged and does not fail the committed write."""
+    async def unavailable(namespace: str) -> None:
+        raise ConnectionError("cache down")
+    
+    monkeypatch.setattr(response_cache_backend, "bump_generation", unavailable)
+    response = client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=auth_headers,
+        json={"title": "Saved"}
+    )
+    assert response.status_code == 201
+    assert "Response cache invalidation failed" in caplog.text
+
+
+def test_read_my_items_cached_per_user(client: TestClient, auth_headers: dict):
+    """Test that cached my-items pages are not shared between users."""
+    client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=auth_headers,
+        json={"title": "Mine"}
+    )
+    assert len(client.get(f"{settings.API_V1_STR}/items/my-items", headers=auth_headers).json()) == 1
+    
+    client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={"email": "other@example.com", "password": "password123"}
+    )
+    login = client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        data={"username": "other@example.com", "password": "password123"}
+    )
+    other_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    response = client.get(f"{settings.API_V1_STR}/items/my-items", headers=other_headers)
+    assert response.json() == []
@@ -1,10 +1,14 @@
 """
 Tests for user endpoints.
 """
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app import crud, schemas
+from app.core import security
 
 
 def test_read_user_me(client: TestClient, auth_headers: dict, test_user: dict):
@@ -43,6 +47,32 @@ def test_update_user_email(client: TestClient, auth_headers: dict):
     assert data["email"] == "newemail@example.com"
 
 
+def test_update_user_email_taken(client: TestClient, auth_headers: dict):
+    """Test that changing email to an existing user's email fails."""
+    client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={"email": "other@example.com", "password": "password123"}
+    )
+    response = client.put(
+        f"{settings.API_V1_STR}/users/me",
+        headers=auth_headers,
+        json={"email": "other@example.com"}
+    )
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("field", ["email", "password", "is_active"])
+def test_update_user_null_field(client: TestClient, auth_headers: dict, field: str):
+    """Test that setting a non-nullable field to null is rejected as invalid input."""
+    response = client.put(
+        f"{settings.API_V1_STR}/users/me",
+        headers=auth_headers,
+        json={field: None}
+    )
+    assert response.status_code == 422
+
+
 def test_read_user_without_auth(client: TestClient):
     """Test that accessing user endpoint without auth fails."""
     response = client.get(f"{settings.API_V1_STR}/users/me")
@@ -68,3 +98,61 @@ def test_update_password(client: TestClient, auth_headers: dict, test_user: dict
         }
     )
     assert login_response.status_code == 200
+
+
+def test_read_user_me_after_update(client: TestClient, auth_headers: dict):
+    """Test that a cached token sees the updated user."""
+    client.get(f"{settings.API_V1_STR}/users/me", headers=auth_headers)
+    client.put(
+        f"{settings.API_V1_STR}/users/me",
+        headers=auth_headers,
+        json={"full_name": "Updated Name"}
+    )
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/users/me",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Updated Name"
+
+
+@pytest.mark.asyncio
+async def test_delete_user_cascades_items(db: AsyncSession, test_user: dict):
+    """Test that deleting a user removes their items without loading them."""
+    user = await crud.crud_user.get_user_by_email(db, email=test_user["email"])
+    await crud.crud_item.create_item(db, item=schemas.ItemCreate(title="Owned"), owner_id=user.id)
+    
+    assert await crud.crud_user.delete_user(db, user_id=user.id)
+    assert await crud.crud_item.count_items(db, owner_id=user.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_read_users_zero_limit(client: TestClient, db: AsyncSession):
+    """Test that limit=0 returns an empty list of users and no cursor."""
+    admin = await crud.crud_user.create_superuser(db, email="admin@example.com", password="adminpass")
+    headers = {"Authorization": f"Bearer {security.create_access_token(subject=admin.email)}"}
+    
+    response = client.get(f"{settings.API_V1_STR}/users/", headers=headers, params={"limit": 0})
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_cached_token_sees_user_changes(
+    client: TestClient, db: AsyncSession, auth_headers: dict, test_user: dict
+):
+    """Test that a cached token still reflects deactivation and deletion of its user."""
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=auth_headers).status_code == 200
+    
+    user = await crud.crud_user.get_user_by_email(db, email=test_user["email"])
+    await crud.crud_user.update_user(db, user_id=user.id, user_update=schemas.UserUpdate(is_active=False))
+    response = client.get(f"{settings.API_V1_STR}/users/me", headers=auth_headers)
+    assert response.status_code == 400
+    
+    await crud.crud_user.delete_user(db, user_id=user.id)
+    response = client.get(f"{settings.API_V1_STR}/users/me", headers=auth_headers)
+    assert response.status_code == 401
+    response = client.get(f"{settings.API_V1_STR}/items/my-items", headers=auth_headers)
+    assert response.status_code == 401
@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for production.
+Runs the app in Uvicorn workers, one per CPU core by default:
+
+    gunicorn -c gunicorn_conf.py app.main:app
+
+The Uvicorn worker uses uvloop and httptools (installed with uvicorn[standard]).
+"""
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master and fork workers from the warm interpreter.
+# No database connections are opened at import time, so nothing is shared
+# across forks; each worker opens its own pool in the lifespan handler.
+preload_app = True
+
+worker_connections = 1024
+keepalive = 5
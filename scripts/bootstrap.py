@@ -0,0 +1,31 @@
+"""
+One-shot database bootstrap.
+Applies Alembic migrations and creates the initial superuser.
+
+Run it from the project root once per deployment (init container / one-shot
+job) before starting the API workers:
+
+    python -m scripts.bootstrap
+"""
+import asyncio
+
+from app.db.init_db import init_db
+from app.db.migrations import upgrade_database
+from app.db.session import SessionLocal, engine
+
+
+async def create_initial_data() -> None:
+    """Create the initial superuser and release pooled connections."""
+    async with SessionLocal() as db:
+        await init_db(db)
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run migrations, then seed initial data."""
+    upgrade_database()
+    asyncio.run(create_initial_data())
+
+
+if __name__ == "__main__":
+    main()